@@ -1,18 +1,29 @@
-import sqlglot
 from sqlglot import exp, parse_one
 from sqlglot.dialects.greenplum import (
-    DistributedByProperty, 
+    DistributedByProperty,
     DistributedRandomlyProperty,
     ExternalProperty,
-    WritableProperty,
-    ReadableProperty,
-    LocationProperty,
     FormatProperty,
-    EncodingProperty,
-    Greenplum
+    LocationProperty,
+    WritableProperty,
 )
 from tests.dialects.test_dialect import Validator
 
+# This is the example provided by the user
+_SQL_FULL_EXAMPLE = """
+create writable external table schema.table (
+col1 text,
+col2 numeric,
+col3 date,
+col4 timestamp
+)
+LOCATION (
+'pxf://connector?profile=JDBC&SERVER=server&BATCH_SIZE=100000'
+) ON ALL
+FORMAT 'CUSTOM' ( FORMATTER='pxfwritable_export' )
+ENCODING 'UTF8';
+"""
+
 
 class TestGreenplum(Validator):
     """
@@ -20,27 +31,11 @@ class TestGreenplum(Validator):
     """
     maxDiff = None
     dialect = "greenplum"
-    
-    def setUp(self):
-        """Setup for Greenplum tests."""
-        # Ensure the property classes are registered in PROPERTIES_LOCATION
-        if hasattr(Greenplum, 'Generator'):
-            if not hasattr(Greenplum.Generator, 'PROPERTIES_LOCATION'):
-                Greenplum.Generator.PROPERTIES_LOCATION = {}
-            
-            Greenplum.Generator.PROPERTIES_LOCATION.update({
-                LocationProperty: exp.Properties.Location.POST_SCHEMA,
-                FormatProperty: exp.Properties.Location.POST_SCHEMA,
-                EncodingProperty: exp.Properties.Location.POST_SCHEMA,
-            })
 
     def test_greenplum_inherits_postgres(self):
         """Test that Greenplum inherits PostgreSQL functionality correctly."""
         sql = "SELECT * FROM table WHERE col1 = 'value'"
-        self.assertEqual(
-            sqlglot.transpile(sql, read="postgres", write="greenplum")[0],
-            sql
-        )
+        self.validate_all(sql, read={"postgres": sql})
         
         # Test PostgreSQL-specific functionality is available in Greenplum
         self.validate_identity("x ? y", "x ? y")
@@ -54,29 +49,22 @@ class TestGreenplum(Validator):
         sql = "CREATE TABLE my_table (id INT, name TEXT) DISTRIBUTED BY (id)"
         
         # Verify it transpiles correctly
-        self.assertEqual(
-            sqlglot.transpile(sql, read="greenplum", write="greenplum")[0],
-            sql
-        )
+        self.validate_identity(sql)
         
         # Transpile from PostgreSQL to Greenplum with DISTRIBUTED BY added
-        postgres_sql = "CREATE TABLE my_table (id INT, name TEXT)"
         transformed_sql = "CREATE TABLE my_table (id INT, name TEXT) DISTRIBUTED BY (id)"
         
-        # Parse the PostgreSQL query and add the DISTRIBUTED BY property
-        create_table = parse_one(postgres_sql, dialect="postgres") 
+        # Copy the parsed PostgreSQL query and add the DISTRIBUTED BY property
+        create_table = parse_one("CREATE TABLE my_table (id INT, name TEXT)", dialect="postgres")
         
         # Add DISTRIBUTED BY property
-        if not create_table.args.get("properties"):
-            create_table.set("properties", exp.Properties(expressions=[]))
-            
-        create_table.args["properties"].append(
-            "expressions", 
-            DistributedByProperty(expressions=[exp.column("id")])
+        create_table.set(
+            "properties",
+            exp.Properties(expressions=[DistributedByProperty(expressions=[exp.column("id")])]),
         )
         
         # Generate the Greenplum SQL
-        generated_sql = create_table.sql(dialect="greenplum")
+        generated_sql = create_table.sql(dialect=self.dialect)
         self.assertEqual(generated_sql, transformed_sql)
 
     def test_distributed_randomly(self):
@@ -84,125 +72,126 @@ class TestGreenplum(Validator):
         sql = "CREATE TABLE my_table (id INT, name TEXT) DISTRIBUTED RANDOMLY"
         
         # Verify it transpiles correctly
-        self.assertEqual(
-            sqlglot.transpile(sql, read="greenplum", write="greenplum")[0],
-            sql
-        )
+        self.validate_identity(sql)
         
         # Transpile from PostgreSQL to Greenplum with DISTRIBUTED RANDOMLY added
-        postgres_sql = "CREATE TABLE my_table (id INT, name TEXT)"
         transformed_sql = "CREATE TABLE my_table (id INT, name TEXT) DISTRIBUTED RANDOMLY"
         
-        # Parse the PostgreSQL query and add the DISTRIBUTED RANDOMLY property
-        create_table = parse_one(postgres_sql, dialect="postgres") 
+        # Copy the parsed PostgreSQL query and add the DISTRIBUTED RANDOMLY property
+        create_table = parse_one("CREATE TABLE my_table (id INT, name TEXT)", dialect="postgres")
         
         # Add DISTRIBUTED RANDOMLY property
-        if not create_table.args.get("properties"):
-            create_table.set("properties", exp.Properties(expressions=[]))
-            
-        create_table.args["properties"].append(
-            "expressions", 
-            DistributedRandomlyProperty()
-        )
+        create_table.set("properties", exp.Properties(expressions=[DistributedRandomlyProperty()]))
         
         # Generate the Greenplum SQL
-        generated_sql = create_table.sql(dialect="greenplum")
+        generated_sql = create_table.sql(dialect=self.dialect)
         self.assertEqual(generated_sql, transformed_sql)
         
     def test_external_table(self):
         """Test Greenplum's EXTERNAL TABLE clause."""
-        # Minimal test case
-        formats_sql = "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CSV'"
-        self.assertEqual(
-            sqlglot.transpile(formats_sql, read="greenplum", write="greenplum")[0],
-            formats_sql
+        for sql in (
+            # Minimal test case
+            "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CSV'",
+            # Test with LOCATION
+            "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') FORMAT 'CSV'",
+            # Test with multiple locations
+            "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host1/path/file1.csv', 'file://host2/path/file2.csv') FORMAT 'CSV'",
+            # Test with FORMAT options
+            "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CUSTOM' (FORMATTER='pxfwritable_export')",
+            # Test with READABLE keyword
+            "CREATE READABLE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') FORMAT 'CSV'",
+            # Test with ON ALL clause
+            "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') ON ALL FORMAT 'CSV'",
+        ):
+            with self.subTest(sql):
+                self.assertIsInstance(self.validate_identity(sql), exp.Create)
+
+        self.validate_identity(
+            "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') ON MASTER FORMAT 'CSV'"
         )
-        
-        # Test with LOCATION
-        location_sql = "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') FORMAT 'CSV'"
-        self.assertEqual(
-            sqlglot.transpile(location_sql, read="greenplum", write="greenplum")[0],
-            location_sql
+        location = self.parse_one(
+            "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') ON ALL FORMAT 'CSV'"
+        ).find(LocationProperty)
+        self.assertEqual(location.args["segments"], "ALL")
+
+        location = LocationProperty(
+            this=exp.Array(expressions=[exp.Literal.string("gpfdist://host:8081/file.csv")]),
+            segments="SEGMENTS",
         )
-        
-        # Test with multiple locations
-        multi_loc_sql = "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host1/path/file1.csv', 'file://host2/path/file2.csv') FORMAT 'CSV'"
         self.assertEqual(
-            sqlglot.transpile(multi_loc_sql, read="greenplum", write="greenplum")[0],
-            multi_loc_sql
+            location.sql(dialect=self.dialect),
+            "LOCATION ('gpfdist://host:8081/file.csv') ON SEGMENTS",
         )
-        
-        # Test with READABLE keyword
-        readable_sql = "CREATE READABLE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') FORMAT 'CSV'"
-        self.assertEqual(
-            sqlglot.transpile(readable_sql, read="greenplum", write="greenplum")[0],
-            readable_sql
+
+        self.validate_identity(
+            "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CSV' (DELIMITER AS ',', HEADER)",
+            "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CSV' (DELIMITER=',', HEADER)",
         )
-        
-        # Test with ON ALL clause
-        on_all_sql = "CREATE EXTERNAL TABLE ext_table (id INT) LOCATION ('file://host/path/file.csv') ON ALL FORMAT 'CSV'"
-        self.assertEqual(
-            sqlglot.transpile(on_all_sql, read="greenplum", write="greenplum")[0],
-            on_all_sql
+
+    def test_format_options(self):
+        """Test the options of Greenplum's FORMAT clause."""
+        prefix = "CREATE EXTERNAL TABLE ext_table (id INT) FORMAT 'CSV'"
+
+        for option, value in (
+            ("DELIMITER", "|"),
+            ("NULL", "\\N"),
+            ("QUOTE", "\""),
+            ("ESCAPE", "~"),
+            ("NEWLINE", "CRLF"),
+        ):
+            with self.subTest(option):
+                self.validate_identity(
+                    f"{prefix} ({option} AS '{value}')", f"{prefix} ({option}='{value}')"
+                )
+                self.validate_identity(f"{prefix} ({option}='{value}')")
+
+        self.validate_identity(f"{prefix} (FORMATTER='pxfwritable_export')")
+        self.validate_identity(f"{prefix} (HEADER, FILL MISSING FIELDS)")
+        self.validate_identity(
+            f"{prefix} (DELIMITER AS ',', NULL AS '', QUOTE AS '\"', HEADER, FILL MISSING FIELDS)",
+            f"{prefix} (DELIMITER=',', NULL='', QUOTE='\"', HEADER, FILL MISSING FIELDS)",
         )
-        
+
+        # Option values are escaped when generated
+        self.validate_identity(f"{prefix} (NULL AS 'it''s')", f"{prefix} (NULL='it''s')")
+
+        format_property = self.parse_one(f"{prefix} (FILL MISSING FIELDS)").find(FormatProperty)
+        self.assertEqual(format_property.args["options"], {"FILL MISSING FIELDS": True})
+
     def test_writable_external_table(self):
         """Test Greenplum's WRITABLE EXTERNAL TABLE clause."""
         # Test writable external table
         sql_writable = "CREATE WRITABLE EXTERNAL TABLE write_table (id INT, name TEXT) LOCATION ('gpfdist://outputhost:8081/export.csv') FORMAT 'CSV'"
         
-        self.assertEqual(
-            sqlglot.transpile(sql_writable, read="greenplum", write="greenplum")[0],
-            sql_writable
-        )
+        self.assertIsNotNone(self.validate_identity(sql_writable).find(WritableProperty))
         
         # Test with complex example including all features
-        sql_complex = """CREATE WRITABLE EXTERNAL TABLE write_table 
-            (id INT, name TEXT) 
-            LOCATION ('pxf://dm_udh_dashboard_grr.kp_weather_d?profile=JDBC&SERVER=cl_dashboard_grr&BATCH_SIZE=100000') 
-            ON ALL 
-            FORMAT 'CUSTOM' (FORMATTER='pxfwritable_export') 
-            ENCODING 'UTF8'"""
-        
-        # Remove whitespace to normalize the SQL for comparison
-        normalized_sql = ' '.join(sql_complex.split())
-        
-        self.assertEqual(
-            ' '.join(sqlglot.transpile(normalized_sql, read="greenplum", write="greenplum")[0].split()),
-            normalized_sql
+        self.validate_identity(
+            "CREATE WRITABLE EXTERNAL TABLE write_table (id INT, name TEXT) LOCATION ('pxf://dm_udh_dashboard_grr.kp_weather_d?profile=JDBC&SERVER=cl_dashboard_grr&BATCH_SIZE=100000') ON ALL FORMAT 'CUSTOM' (FORMATTER='pxfwritable_export') ENCODING 'UTF8'"
         )
         
         # Test programmatic creation
         create_table = parse_one("CREATE TABLE write_table (id INT, name TEXT)", dialect="postgres")
         
-        # Add WRITABLE and EXTERNAL properties
-        if not create_table.args.get("properties"):
-            create_table.set("properties", exp.Properties(expressions=[]))
-            
-        create_table.args["properties"].append(
-            "expressions", 
-            WritableProperty()
-        )
-        
-        create_table.args["properties"].append(
-            "expressions", 
-            ExternalProperty()
-        )
-        
-        # Add LOCATION property
-        create_table.args["properties"].append(
-            "expressions", 
-            LocationProperty(this=exp.Array(expressions=[exp.Literal.string("gpfdist://outputhost:8081/export.csv")]), segments=None)
-        )
-        
-        # Add FORMAT property
-        create_table.args["properties"].append(
-            "expressions", 
-            FormatProperty(this=exp.Literal.string("CSV"), options=None)
+        # Add WRITABLE, EXTERNAL, LOCATION and FORMAT properties
+        create_table.set(
+            "properties",
+            exp.Properties(
+                expressions=[
+                    WritableProperty(),
+                    ExternalProperty(),
+                    LocationProperty(
+                        this=exp.Array(
+                            expressions=[exp.Literal.string("gpfdist://outputhost:8081/export.csv")]
+                        )
+                    ),
+                    FormatProperty(this=exp.Literal.string("CSV")),
+                ]
+            ),
         )
         
         # Generate the Greenplum SQL
-        generated_sql = create_table.sql(dialect="greenplum")
+        generated_sql = create_table.sql(dialect=self.dialect)
         self.assertEqual(
             generated_sql, 
             "CREATE WRITABLE EXTERNAL TABLE write_table (id INT, name TEXT) LOCATION ('gpfdist://outputhost:8081/export.csv') FORMAT 'CSV'"
@@ -210,30 +199,9 @@ class TestGreenplum(Validator):
         
     def test_full_external_table_example(self):
         """Test full external table example with all features."""
-        # This is the example provided by the user
-        sql = """
-        create writable external table schema.table (
-        col1 text,
-        col2 numeric,
-        col3 date,
-        col4 timestamp
+        self.validate_identity(
+            _SQL_FULL_EXAMPLE,
+            "CREATE WRITABLE EXTERNAL TABLE schema.table (col1 TEXT, col2 DECIMAL, col3 DATE, col4 TIMESTAMP) "
+            "LOCATION ('pxf://connector?profile=JDBC&SERVER=server&BATCH_SIZE=100000') ON ALL "
+            "FORMAT 'CUSTOM' (FORMATTER='pxfwritable_export') ENCODING 'UTF8'",
         )
-        LOCATION (
-        'pxf://connector?profile=JDBC&SERVER=server&BATCH_SIZE=100000'
-        ) ON ALL
-        FORMAT 'CUSTOM' ( FORMATTER='pxfwritable_export' )
-        ENCODING 'UTF8';
-        """
-        
-        # Normalize the SQL for comparison (remove whitespace)
-        normalized_sql = ' '.join(sql.strip().split())
-        
-        # Parse and generate
-        parsed = parse_one(sql, dialect="greenplum")
-        generated = parsed.sql(dialect="greenplum")
-        
-        # Normalize the generated SQL
-        normalized_generated = ' '.join(generated.strip().split())
-        
-        # Compare normalized versions
-        self.assertEqual(normalized_generated, normalized_sql.rstrip(";")) 
\ No newline at end of file